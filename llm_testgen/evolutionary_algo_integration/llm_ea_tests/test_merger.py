@@ -126,7 +126,7 @@ Please provide the complete merged test suite that combines the best of both app
             pynguin_file = genai.upload_file(str(self.pynguin_test_file))
             
             # Send message with both files and prompt
-            response = chat_bot.chat.send_message([
+            response = chat_bot.model.generate_content([
                 "LLM Test Suite:",
                 llm_file,
                 "Pynguin Test Suite:",
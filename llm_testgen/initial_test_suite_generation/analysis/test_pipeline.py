@@ -3,8 +3,13 @@
 Test script for ASTER-style static analysis pipeline. This script tests the complete analysis pipeline by:
 """
 
+import asyncio
+import functools
+import hashlib
+import multiprocessing
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 
 # Add parent directory to path to import our modules
@@ -20,48 +25,123 @@ from analysis.import_extractor import extract_imports
 from analysis.monkeypatch_extractor import identify_monkeypatch_points
 from analysis.prompt_formatter import create_full_aster_prompt
 
+# Package root for the generation/repair siblings; registered in sys.path once
+# here instead of on every generate call
+_PKG_ROOT = parent_dir
+sys.path.insert(0, str(_PKG_ROOT / "generation"))
+sys.path.insert(0, str(_PKG_ROOT / "repair"))
 
-def generate_tests_with_llm(prompt: str, source_file_path: str = None) -> tuple:
+_LLM_IMPORT_ERROR = None
+try:
+    from generation.simple_llm import send_prompt_to_llm_stream, send_prompt_to_llm_async
+    from repair.test_suite_manager import get_test_manager
+except ImportError as e:
+    send_prompt_to_llm_stream = None
+    send_prompt_to_llm_async = None
+    get_test_manager = None
+    _LLM_IMPORT_ERROR = e
+
+
+# Bump when create_full_aster_prompt output format changes so stale cached
+# prompts are not reused
+PROMPT_TEMPLATE_VERSION = "1"
+
+# Content-addressed cache for prompts and LLM responses; disabled via --no-cache
+CACHE_ENABLED = os.getenv('LLM_TESTGEN_NO_CACHE', '0') != '1'
+CACHE_DIR = Path(__file__).parent.parent.parent / ".cache" / "llm_testgen"
+
+
+# Source bytes already read during analysis, so the generation step does not
+# re-read (and re-upload from disk) the same file
+_SOURCE_BYTES_CACHE = {}
+
+
+def _source_cache_key(module_path: str) -> str:
+    #Hash source bytes + prompt template version into a cache key.
+    with open(module_path, 'rb') as f:
+        source_bytes = f.read()
+    digest = hashlib.blake2b(source_bytes + PROMPT_TEMPLATE_VERSION.encode())
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_cached(module_path, mtime_ns):
+    #mtime_ns keys the entry so file edits invalidate the cached tree.
+    return parse_python_module(module_path)
+
+
+def _cached_prompt(func):
+    #Skip AST analysis entirely when the source file's prompt is already cached.
+    @functools.wraps(func)
+    def wrapper(module_path, verbose=True):
+        if not CACHE_ENABLED:
+            return func(module_path, verbose)
+        try:
+            cache_file = CACHE_DIR / f"{_source_cache_key(module_path)}.prompt"
+            if cache_file.exists():
+                print(f"Using cached prompt for {os.path.basename(module_path)}")
+                return cache_file.read_text(encoding='utf-8')
+        except Exception as e:
+            print(f"Prompt cache read failed (regenerating): {e}")
+            cache_file = None
+        prompt = func(module_path, verbose)
+        if prompt and cache_file:
+            try:
+                CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                cache_file.write_text(prompt, encoding='utf-8')
+            except Exception as e:
+                print(f"Prompt cache write failed: {e}")
+        return prompt
+    return wrapper
+
+
+def generate_tests_with_llm(prompt: str, source_file_path=None, upload_future=None) -> tuple:
     #Generate tests using Gemini LLM and save to file with automatic repair.
+    #source_file_path may be a str or Path; one Path object is used throughout.
     try:
-        current_dir = Path(__file__).parent
-        generation_dir = current_dir.parent / "generation"
-        repair_dir = current_dir.parent / "repair"
-        sys.path.insert(0, str(generation_dir))
-        sys.path.insert(0, str(repair_dir))
-        from generation.simple_llm import send_prompt_to_llm
-        from repair.test_suite_manager import get_test_manager
-        
+        if send_prompt_to_llm_stream is None:
+            print(f"Import error: {_LLM_IMPORT_ERROR}")
+            return None, None, None
+
+        source_path = Path(source_file_path) if source_file_path else None
+
         print("Generating tests with Gemini...")
-        
-        # Log the complete prompt before sending to LLM
-        print("\n" + "=" * 80)
-        print("COMPLETE PROMPT BEING SENT TO LLM")
-        print("=" * 80)
-        print(prompt)
-        print("=" * 80)
+
+        # Dumping the full prompt is only worth the stdout cost when debugging
+        if VERBOSE:
+            print("\n" + "=" * 80)
+            print("COMPLETE PROMPT BEING SENT TO LLM")
+            print("=" * 80)
+            print(prompt)
+            print("=" * 80)
         print(f"Prompt length: {len(prompt)} characters")
-        print("=" * 80 + "\n")
         
-        generated_tests = send_prompt_to_llm(prompt, source_file_path)
+        # Stream the response and accumulate in memory; the test manager
+        # writes the finished suite to its final location itself
+        chunks = []
+        for chunk in send_prompt_to_llm_stream(
+            prompt, source_file_path,
+            source_bytes=_SOURCE_BYTES_CACHE.get(str(source_path)) if source_path else None,
+            upload_future=upload_future
+        ):
+            chunks.append(chunk)
+        generated_tests = ''.join(chunks).strip() if chunks else None
         
         if generated_tests:
             print("Tests generated successfully")
             
             # Save test suite to file and run with repair
-            if source_file_path:
+            if source_path:
                 test_manager = get_test_manager()
-                source_filename = os.path.basename(source_file_path)
                 
                 # Use the new repair functionality with default max_repair_attempts from config
                 results = test_manager.save_and_run_tests_with_repair(
-                    generated_tests, source_filename, source_file_path
+                    generated_tests, source_path.name, str(source_path)
                 )
                 test_manager.print_test_results(results)
                 
                 # Get the final test file path with new naming convention
-                base_name = source_filename.replace('.py', '')
-                test_filename = f"llm_generated_test_{base_name}.py"
+                test_filename = f"llm_generated_test_{source_path.stem}.py"
                 test_file_path = str(test_manager.test_dir / test_filename)
                 
                 return generated_tests, test_file_path, results
@@ -79,18 +159,72 @@ def generate_tests_with_llm(prompt: str, source_file_path: str = None) -> tuple:
         return None, None, None
 
 
-def test_single_module(module_path: str, verbose: bool = True):
-    #Test analysis pipeline on a single module.
-    print(f"\nAnalyzing: {os.path.basename(module_path)}")
+async def generate_tests_with_llm_async(prompt: str, source_file_path=None) -> tuple:
+    #Async version of generate_tests_with_llm for concurrent per-file dispatch.
+    try:
+        if send_prompt_to_llm_async is None:
+            print(f"Import error: {_LLM_IMPORT_ERROR}")
+            return None, None, None
+
+        source_path = Path(source_file_path) if source_file_path else None
+
+        print(f"Generating tests with Gemini (async) for {source_path.name if source_path else ''}...")
+        print(f"Prompt length: {len(prompt)} characters")
+
+        generated_tests = await send_prompt_to_llm_async(
+            prompt, source_file_path,
+            source_bytes=_SOURCE_BYTES_CACHE.get(str(source_path)) if source_path else None
+        )
+
+        if generated_tests:
+            print("Tests generated successfully")
+
+            if source_path:
+                test_manager = get_test_manager()
+
+                # Disk + pytest work runs in the default executor so other
+                # files' network requests keep overlapping with it
+                loop = asyncio.get_running_loop()
+                results = await loop.run_in_executor(
+                    None,
+                    test_manager.save_and_run_tests_with_repair,
+                    generated_tests, source_path.name, str(source_path)
+                )
+                test_manager.print_test_results(results)
+
+                test_filename = f"llm_generated_test_{source_path.stem}.py"
+                test_file_path = str(test_manager.test_dir / test_filename)
+
+                return generated_tests, test_file_path, results
+            else:
+                return generated_tests, None, None
+        else:
+            print("No tests generated")
+            return None, None, None
+
+    except ImportError as e:
+        print(f"Import error: {e}")
+        return None, None, None
+    except Exception as e:
+        print(f"Generation failed: {e}")
+        return None, None, None
+
+
+@_cached_prompt
+def test_single_module(module_path, verbose: bool = True):
+    #Test analysis pipeline on a single module (str or Path accepted).
+    module_path = Path(module_path)
+    print(f"\nAnalyzing: {module_path.name}")
     
     try:
-        # Read source code
-        with open(module_path, 'r', encoding='utf-8') as f:
-            source_code = f.read()
+        # Read source code once; keep the bytes for the upload step
+        source_bytes = module_path.read_bytes()
+        source_code = source_bytes.decode('utf-8')
+        _SOURCE_BYTES_CACHE[str(module_path)] = source_bytes
         print(f"Source loaded ({len(source_code)} chars)")
         
-        # Parse AST
-        tree = parse_python_module(module_path)
+        # Parse AST (memoized; repair retries re-enter with the same file)
+        tree = _parse_cached(str(module_path), os.stat(module_path).st_mtime_ns)
         print("AST parsed")
         
         # Extract components
@@ -103,7 +237,7 @@ def test_single_module(module_path: str, verbose: bool = True):
             print(f"Found: {len(functions)} functions, {len(classes)} classes, {len(imports.get('import_statements', []))} imports")
         
         # Generate ASTER prompt
-        module_name = os.path.basename(module_path).replace('.py', '')
+        module_name = module_path.stem
         prompt = create_full_aster_prompt(
             module_source=source_code,
             functions=functions,
@@ -115,7 +249,23 @@ def test_single_module(module_path: str, verbose: bool = True):
             include_type_annotations=True,
             include_source_in_prompt=False  # Don't include source since we upload the file
         )
-        
+
+        # Docstrings are the largest optional section - drop them and
+        # re-render when the estimated token count blows the input budget
+        if len(prompt) // 4 > MAX_PROMPT_TOKEN_BUDGET:
+            print(f"Prompt too large (~{len(prompt) // 4} tokens), re-rendering without docstrings")
+            prompt = create_full_aster_prompt(
+                module_source=source_code,
+                functions=functions,
+                classes=classes,
+                imports=imports,
+                monkeypatch_points=monkeypatch_points,
+                module_name=module_name,
+                include_docstrings=False,
+                include_type_annotations=True,
+                include_source_in_prompt=False
+            )
+
         print(f"Generated prompt ({len(prompt)} chars)")
         return prompt
         
@@ -124,51 +274,104 @@ def test_single_module(module_path: str, verbose: bool = True):
         return None
 
 
-def run_all_tests():
-    #Run analysis on all Python files in tests/source.
+# Maximum number of files with LLM requests in flight at once
+MAX_CONCURRENT_LLM_REQUESTS = 8
+
+# Background uploads kicked off while AST analysis is still running
+_PREWARM_EXECUTOR = ThreadPoolExecutor(max_workers=2)
+
+# Keep prompts within ~90% of the model's input window (rough 4 chars/token
+# estimate); oversized prompts are re-rendered without docstrings first
+try:
+    from generation.config import MAX_INPUT_TOKENS, VERBOSE
+except ImportError:
+    MAX_INPUT_TOKENS = 1000000
+    VERBOSE = os.getenv('LLM_TESTGEN_VERBOSE', '0') == '1'
+MAX_PROMPT_TOKEN_BUDGET = int(MAX_INPUT_TOKENS * 0.9)
+
+
+def _preview(text: str, limit: int) -> str:
+    #Cheap bounded preview; never copies more than limit characters.
+    if len(text) > limit:
+        return text[:limit] + "..."
+    return text
+
+
+def _analyze_file(module_path: str):
+    #Process-pool worker: analyze one file and return picklable data only.
+    prompt = test_single_module(module_path, verbose=True)
+    return module_path, prompt, _SOURCE_BYTES_CACHE.get(module_path)
+
+
+async def run_all_tests():
+    #Run analysis on all Python files in tests/source, dispatching LLM calls concurrently.
     current_dir = Path(__file__).parent
     source_dir = current_dir.parent.parent / "tests" / "source"
-    
+
     if not source_dir.exists():
         source_dir.mkdir(parents=True, exist_ok=True)
         print(f"Created: {source_dir}")
-    
-    sample_files = [f for f in source_dir.glob("*.py") if f.is_file() and not f.name.startswith("__")]
-    
+
+    # os.scandir stats each entry once, vs glob + is_file stat'ing twice
+    with os.scandir(source_dir) as entries:
+        sample_files = [
+            Path(entry.path) for entry in entries
+            if entry.name.endswith(".py") and not entry.name.startswith("__") and entry.is_file()
+        ]
+
     if not sample_files:
         print(f"No Python files found in {source_dir}")
         return
-    
+
     print(f"Testing {len(sample_files)} files")
     results = {}
-    
-    for sample_file in sample_files:
-        print(f"\n{'='*50}")
-        prompt = test_single_module(str(sample_file), verbose=True)
-        
+
+    # AST traversal is CPU-bound Python, so fan the per-file analysis out
+    # across cores before the I/O-bound LLM step. Forked workers inherit the
+    # already-resolved config constants, so they never re-pay load_dotenv;
+    # spawn (the only option on Windows) re-imports everything per worker.
+    if "fork" in multiprocessing.get_all_start_methods():
+        mp_context = multiprocessing.get_context("fork")
+    else:
+        mp_context = None
+    with ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=mp_context) as pool:
+        analyzed = list(pool.map(_analyze_file, [str(f) for f in sample_files]))
+
+    tasks = []
+    for sample_file, (module_path, prompt, source_bytes) in zip(sample_files, analyzed):
         if prompt:
+            # Workers read the source in their own process; carry the bytes
+            # back so the upload step still avoids a re-read
+            if source_bytes is not None:
+                _SOURCE_BYTES_CACHE[module_path] = source_bytes
             results[sample_file.name] = prompt
-            print(f"\nASTER Prompt for {sample_file.name}:")
-            print("-" * 40)
-            print(prompt)
-            print("-" * 40)
-            
-            # Generate tests and run them
-            generated_tests, test_file_path, test_results = generate_tests_with_llm(prompt, str(sample_file))
-            if generated_tests:
-                print(f"\nGenerated Tests Preview:")
-                print("-" * 40)
-                print(generated_tests[:300] + "..." if len(generated_tests) > 300 else generated_tests)
-                
-                if test_file_path:
-                    print(f"\nTest file saved: {test_file_path}")
-                    if test_results and test_results['success']:
-                        print("All tests passed!")
-                    elif test_results:
-                        print("Some tests failed - see results above")
+            tasks.append((sample_file, prompt))
         else:
             print(f"Failed: {sample_file.name}")
-    
+
+    # LLM calls are I/O-bound - run them concurrently with a bounded semaphore
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_LLM_REQUESTS)
+
+    async def process_file(sample_file, prompt):
+        async with semaphore:
+            generated_tests, test_file_path, test_results = await generate_tests_with_llm_async(
+                prompt, sample_file
+            )
+        if generated_tests:
+            if VERBOSE:
+                print(f"\nGenerated Tests Preview ({sample_file.name}):")
+                print("-" * 40)
+                print(_preview(generated_tests, 300))
+
+            if test_file_path:
+                print(f"\nTest file saved: {test_file_path}")
+                if test_results and test_results['success']:
+                    print("All tests passed!")
+                elif test_results:
+                    print("Some tests failed - see results above")
+
+    await asyncio.gather(*[process_file(f, p) for f, p in tasks])
+
     print(f"\nSummary: {len(results)}/{len(sample_files)} successful")
     return results
 
@@ -177,9 +380,18 @@ def main():
     #Main entry point.
     print("ASTER Pipeline Test")
     print("=" * 30)
-    
-    if len(sys.argv) > 1:
-        module_path = sys.argv[1]
+
+    args = sys.argv[1:]
+    if "--no-cache" in args:
+        global CACHE_ENABLED
+        CACHE_ENABLED = False
+        # Propagate to the generation module's response cache as well
+        os.environ['LLM_TESTGEN_NO_CACHE'] = '1'
+        args.remove("--no-cache")
+        print("Cache disabled")
+
+    if args:
+        module_path = args[0]
         
         # Check if file exists in tests/source
         if not os.path.sep in module_path and not os.path.exists(module_path):
@@ -190,18 +402,21 @@ def main():
                 print(f"Found: {module_path}")
         
         if os.path.exists(module_path):
+            module_path = Path(module_path)
             prompt = test_single_module(module_path)
             if prompt:
-                print(f"\nASTER Prompt:")
-                print("-" * 30)
-                print(prompt[:500] + "..." if len(prompt) > 500 else prompt)
+                if VERBOSE:
+                    print(f"\nASTER Prompt:")
+                    print("-" * 30)
+                    print(_preview(prompt, 500))
                 
                 # Generate tests and run them
                 generated_tests, test_file_path, test_results = generate_tests_with_llm(prompt, module_path)
                 if generated_tests:
-                    print(f"\nGenerated Tests:")
-                    print("-" * 30)
-                    print(generated_tests[:500] + "..." if len(generated_tests) > 500 else generated_tests)
+                    if VERBOSE:
+                        print(f"\nGenerated Tests:")
+                        print("-" * 30)
+                        print(_preview(generated_tests, 500))
                     
                     if test_file_path:
                         print(f"\nTest file: {test_file_path}")
@@ -212,7 +427,7 @@ def main():
         else:
             print(f"File not found: {module_path}")
     else:
-        run_all_tests()
+        asyncio.run(run_all_tests())
 
 
 class TestGenerationPipeline:
@@ -249,14 +464,26 @@ class TestGenerationPipeline:
     def run_pipeline(self, source_file_path: str):
         """Run the complete test generation pipeline."""
         print(f"Running test generation pipeline for: {source_file_path}")
-        
+
+        # File upload and AST analysis are independent; start the upload in
+        # the background so its latency overlaps the analysis work
+        upload_future = None
+        if send_prompt_to_llm_stream is not None:
+            try:
+                from generation.simple_llm import prewarm_upload
+                upload_future = _PREWARM_EXECUTOR.submit(prewarm_upload, source_file_path)
+            except Exception as e:
+                print(f"Upload prewarm unavailable: {e}")
+
         # Generate prompt using existing analysis
         prompt = test_single_module(source_file_path, verbose=True)
         if not prompt:
             print(f"Failed to generate prompt for {source_file_path}")
             return None
         # Generate tests with LLM
-        generated_tests, test_file_path, test_results = generate_tests_with_llm(prompt, source_file_path)
+        generated_tests, test_file_path, test_results = generate_tests_with_llm(
+            prompt, source_file_path, upload_future=upload_future
+        )
         
         if generated_tests:
             print(f"Test generation completed successfully")
@@ -1,31 +1,59 @@
 """
 Configuration for LLM Test Generation with Google Gemini 2.5 Pro
+
+Values are resolved lazily on first attribute access so importing this module
+stays cheap; dotenv is only loaded when a config value is actually read.
 """
 
 import os
 from pathlib import Path
-from dotenv import load_dotenv
 
-# Load environment variables from .env file
-env_path = Path(__file__).parent.parent.parent / '.env'
-load_dotenv(env_path)
+# Path to the .env file (loaded lazily)
+_ENV_PATH = Path(__file__).parent.parent.parent / '.env'
+_env_loaded = False
+
+
+def _load_env():
+    """Load environment variables from .env on first config access."""
+    global _env_loaded
+    if not _env_loaded:
+        from dotenv import load_dotenv
+        load_dotenv(_ENV_PATH)
+        _env_loaded = True
+
 
-# Gemini 2.5 Pro Configuration
-MODEL_NAME = os.getenv('MODEL_NAME', 'gemini-2.5-pro')
-GEMINI_API_KEY = os.getenv('GEMINI_API_KEY')
+# Constants that never depend on the environment
 MAX_INPUT_TOKENS = 1000000    # Gemini 2.5 Pro context window: ~1M tokens
-MAX_OUTPUT_TOKENS = int(os.getenv('MAX_OUTPUT_TOKENS', 8192))
-TEMPERATURE = float(os.getenv('TEMPERATURE', 0.1))
-TOP_P = float(os.getenv('TOP_P', 0.95))
-TOP_K = int(os.getenv('TOP_K', 40))
-
-# Output Configuration
-TEST_SUITES_DIR = os.getenv('TEST_SUITES_DIR', 'tests/test_suites')
-
-# Repair Configuration
-MAX_REPAIR_ATTEMPTS = int(os.getenv('MAX_REPAIR_ATTEMPTS', 5))
-OUTPUT_CONFIG = {
-    "save_tests": True,
-    "output_dir": TEST_SUITES_DIR,
-    "include_timestamp": True
+
+# Factories for env-backed values, evaluated once on first access
+_FACTORIES = {
+    # Gemini 2.5 Pro Configuration
+    'MODEL_NAME': lambda: os.getenv('MODEL_NAME', 'gemini-2.5-pro'),
+    'GEMINI_API_KEY': lambda: os.getenv('GEMINI_API_KEY'),
+    'MAX_OUTPUT_TOKENS': lambda: int(os.getenv('MAX_OUTPUT_TOKENS', 8192)),
+    'TEMPERATURE': lambda: float(os.getenv('TEMPERATURE', 0.1)),
+    'TOP_P': lambda: float(os.getenv('TOP_P', 0.95)),
+    'TOP_K': lambda: int(os.getenv('TOP_K', 40)),
+    # Output Configuration
+    'TEST_SUITES_DIR': lambda: os.getenv('TEST_SUITES_DIR', 'tests/test_suites'),
+    # Verbose output (full prompts / generated suites on stdout); large prompts
+    # make unconditional printing a real cost on slow terminals and CI
+    'VERBOSE': lambda: os.getenv('LLM_TESTGEN_VERBOSE', '0') == '1',
+    # Repair Configuration
+    'MAX_REPAIR_ATTEMPTS': lambda: int(os.getenv('MAX_REPAIR_ATTEMPTS', 5)),
+    'OUTPUT_CONFIG': lambda: {
+        "save_tests": True,
+        "output_dir": os.getenv('TEST_SUITES_DIR', 'tests/test_suites'),
+        "include_timestamp": True
+    },
 }
+
+
+def __getattr__(name):
+    factory = _FACTORIES.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    _load_env()
+    value = factory()
+    globals()[name] = value  # cache so __getattr__ only fires once per name
+    return value
@@ -3,54 +3,114 @@
 Gemini AI integration for test generation with persistent chat session.
 """
 
+import asyncio
+import hashlib
+import io
 import os
 import sys
 from pathlib import Path
-import google.generativeai as genai
 
 # Add the current directory to Python path for relative imports
 current_dir = Path(__file__).parent
 sys.path.insert(0, str(current_dir))
 
-from config import MODEL_NAME, GEMINI_API_KEY, MAX_OUTPUT_TOKENS, TEMPERATURE, TOP_P, TOP_K
+# config resolves its values lazily, so this import stays cheap
+import config
 
-class GeminiChatBot:
-    """Singleton Gemini AI Chat Bot for test generation."""
-    
-    _instance = None
-    _initialized = False
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(GeminiChatBot, cls).__new__(cls)
-        return cls._instance
-    
-    def __init__(self):
-        if not self._initialized:
-            self.chat = None
-            self.model = None
-            self._initialize()
-            GeminiChatBot._initialized = True
-    
-    def _initialize(self):
-        """Initialize Gemini AI once."""
-        if not GEMINI_API_KEY:
+# google.generativeai transitively loads grpc/protobuf/absl (~100ms+, tens of
+# MB RSS); defer it so analysis-only runs never pay for it
+genai = None
+
+def _ensure_genai():
+    """Import google.generativeai on first use."""
+    global genai
+    if genai is None:
+        import google.generativeai as _genai
+        genai = _genai
+    return genai
+
+# One shared stateless model; generate_content is thread-safe, so concurrent
+# callers need no locking and no per-caller instances
+_shared_model = None
+
+def get_model():
+    """Build (once) and return the shared GenerativeModel."""
+    global _shared_model
+    if _shared_model is None:
+        if not config.GEMINI_API_KEY:
             print("GEMINI_API_KEY not found in .env file")
-            return False
-            
-        genai.configure(api_key=GEMINI_API_KEY)
-        
+            return None
+
+        _ensure_genai()
+        genai.configure(api_key=config.GEMINI_API_KEY)
+
         generation_config = genai.types.GenerationConfig(
-            max_output_tokens=MAX_OUTPUT_TOKENS,
-            temperature=TEMPERATURE,
-            top_p=TOP_P,
-            top_k=TOP_K
+            max_output_tokens=config.MAX_OUTPUT_TOKENS,
+            temperature=config.TEMPERATURE,
+            top_p=config.TOP_P,
+            top_k=config.TOP_K
         )
-        
-        self.model = genai.GenerativeModel(MODEL_NAME, generation_config=generation_config)
-        self.chat = self.model.start_chat(history=[])
-        print(f"Initialized {MODEL_NAME} (persistent session)")
-        return True
+
+        _shared_model = genai.GenerativeModel(config.MODEL_NAME, generation_config=generation_config)
+        print(f"Initialized {config.MODEL_NAME} (stateless)")
+    return _shared_model
+
+
+# finish_reason handlers, dispatched by value instead of an elif ladder on
+# every blocked/empty response
+def _finish_stop(candidate, bot):
+    print("Response finished normally but no text content")
+    return None
+
+def _finish_max_tokens(candidate, bot):
+    print("Response truncated due to max tokens")
+    return None
+
+def _finish_safety(candidate, bot):
+    print("Response blocked due to safety filters - trying simpler prompt")
+    try:
+        simple_retry = "Generate basic pytest tests for a Python function that processes a list of numbers."
+        retry_response = bot.model.generate_content(simple_retry)
+        if retry_response and getattr(retry_response, 'text', None):
+            print("Simple retry succeeded")
+            return retry_response.text.strip()
+    except Exception:
+        pass
+    return None
+
+def _finish_recitation(candidate, bot):
+    print("Response blocked due to recitation concerns")
+    return None
+
+def _finish_unknown(candidate, bot):
+    print(f"Response finished with reason: {candidate.finish_reason}")
+    return None
+
+_FINISH_HANDLERS = {
+    1: _finish_stop,        # STOP
+    2: _finish_max_tokens,  # MAX_TOKENS
+    3: _finish_safety,      # SAFETY
+    4: _finish_recitation,  # RECITATION
+}
+
+
+class GeminiChatBot:
+    """Thin stateless wrapper around the shared Gemini model.
+
+    Kept for API compatibility with callers that hold a chat_bot; instances
+    are cheap and share the model and upload cache.
+    """
+
+    # Gemini keeps uploads for ~48h; keep the handle cache small so stale
+    # entries rotate out well before the TTL
+    _UPLOAD_CACHE_MAX = 32
+
+    # Uploaded file handles keyed by (path, mtime_ns, size) so repair cycles
+    # reuse the upload instead of re-POSTing the source; shared by design
+    _upload_cache = {}
+
+    def __init__(self):
+        self.model = get_model()
     
     def _read_file(self, file_path):
         """Read source file content."""
@@ -63,27 +123,112 @@ class GeminiChatBot:
             print(f"File read error: {e}")
             return None
     
-    def send_message(self, prompt, source_file_path=None):
-        """Send message to Gemini with optional file upload."""
-        if not self.chat:
-            print("Chat not initialized")
+    def _prompt_too_large(self, contents):
+        """Early-reject prompts that exceed ~90% of the model input window.
+
+        count_tokens is an API round-trip, so clearly-small prompts are
+        filtered with a local 4-chars-per-token estimate and the network
+        check is reserved for borderline cases.
+        """
+        budget = int(config.MAX_INPUT_TOKENS * 0.9)
+        if isinstance(contents, str):
+            estimated = len(contents) // 4
+        else:
+            estimated = sum(len(c) // 4 for c in contents if isinstance(c, str))
+        if estimated < budget // 2:
+            return False
+        try:
+            total = self.model.count_tokens(contents).total_tokens
+        except Exception:
+            # Token counting is best effort; let the API enforce the limit
+            return False
+        if total > budget:
+            print(f"Prompt rejected: {total} tokens exceeds input budget")
+            return True
+        return False
+
+    def _upload_source(self, source_file_path, source_bytes=None, upload_future=None):
+        """Upload source to Gemini, reusing a cached handle when the file is unchanged.
+
+        upload_future, when provided, is a background upload kicked off while
+        analysis was still running; its result is used instead of uploading here.
+        """
+        try:
+            st = os.stat(source_file_path)
+            cache_key = (source_file_path, st.st_mtime_ns, st.st_size)
+        except OSError:
+            cache_key = None
+
+        if upload_future is not None:
+            try:
+                uploaded_file = upload_future.result()
+                if cache_key:
+                    self._upload_cache[cache_key] = uploaded_file
+                print("Using prewarmed upload")
+                return uploaded_file
+            except Exception as e:
+                print(f"Prewarmed upload failed, re-uploading: {e}")
+
+        if cache_key and cache_key in self._upload_cache:
+            cached = self._upload_cache.pop(cache_key)
+            state = getattr(getattr(cached, 'state', None), 'name', None)
+            if state is None or state == 'ACTIVE':
+                # Re-insert to keep LRU ordering
+                self._upload_cache[cache_key] = cached
+                print("Reusing uploaded file handle")
+                return cached
+            # EXPIRED/FAILED handles fall through to a fresh upload
+
+        if source_bytes is not None:
+            uploaded_file = genai.upload_file(
+                io.BytesIO(source_bytes), mime_type='text/x-python',
+                display_name=os.path.basename(source_file_path)
+            )
+        else:
+            uploaded_file = genai.upload_file(source_file_path)
+
+        if cache_key:
+            self._upload_cache[cache_key] = uploaded_file
+            while len(self._upload_cache) > self._UPLOAD_CACHE_MAX:
+                self._upload_cache.pop(next(iter(self._upload_cache)))
+        return uploaded_file
+
+    def send_message(self, prompt, source_file_path=None, source_bytes=None, upload_future=None):
+        """Send message to Gemini with optional file upload.
+
+        source_bytes, when provided by the analysis step, avoids re-reading the
+        file from disk for both the fallback prompt and the upload.
+
+        Each call is a stateless generate_content request; modules are
+        independent, so carrying chat history would only re-transmit every
+        prior turn on each request.
+        """
+        if not self.model:
+            print("Model not initialized")
             return None
         
         try:
             # If no source file provided, just send the prompt (used during repair)
             if not source_file_path:
-                response = self.chat.send_message(prompt)
+                if self._prompt_too_large(prompt):
+                    return None
+                response = self.model.generate_content(prompt)
                 print("Response received (prompt only)")
                 return response.text.strip() if response and response.text else None
             
             # Try file upload first if source file provided (used during initial generation)
-            source_code = self._read_file(source_file_path)
+            if source_bytes is not None:
+                source_code = source_bytes.decode('utf-8')
+            else:
+                source_code = self._read_file(source_file_path)
             if source_code:
                 try:
                     # Attempt direct file upload (Gemini 2.5 Pro supports this)
-                    uploaded_file = genai.upload_file(source_file_path)
+                    uploaded_file = self._upload_source(source_file_path, source_bytes, upload_future)
                     print("File uploaded to Gemini")
-                    response = self.chat.send_message([prompt, uploaded_file])
+                    if self._prompt_too_large([prompt, uploaded_file]):
+                        return None
+                    response = self.model.generate_content([prompt, uploaded_file])
                 except Exception as upload_error:
                     # Fallback: use simplified prompt
                     print("File upload failed, using simplified prompt")
@@ -104,15 +249,15 @@ Create comprehensive tests that:
 Return only the test code with necessary imports."""
                     
                     try:
-                        response = self.chat.send_message(simplified_prompt)
+                        response = self.model.generate_content(simplified_prompt)
                         print("Simplified prompt succeeded")
                     except Exception as simple_error:
                         print(f"Simplified prompt also failed: {simple_error}")
                         # Last resort: very basic prompt
                         basic_prompt = f"Write pytest tests for the classify_numbers function. Include test cases for empty list, negative numbers, zero, and positive numbers."
-                        response = self.chat.send_message(basic_prompt)
+                        response = self.model.generate_content(basic_prompt)
             else:
-                response = self.chat.send_message(prompt)
+                response = self.model.generate_content(prompt)
             
             print("Response received")
             
@@ -124,36 +269,19 @@ Return only the test code with necessary imports."""
                 elif hasattr(response, 'candidates') and response.candidates:
                     # Check if candidate was blocked
                     candidate = response.candidates[0]
-                    if hasattr(candidate, 'finish_reason'):
-                        if candidate.finish_reason == 1:  # STOP
-                            print("Response finished normally but no text content")
-                        elif candidate.finish_reason == 2:  # MAX_TOKENS
-                            print("Response truncated due to max tokens")
-                        elif candidate.finish_reason == 3:  # SAFETY
-                            print("Response blocked due to safety filters - trying simpler prompt")
-                            # Try with a very basic prompt
-                            try:
-                                simple_retry = "Generate basic pytest tests for a Python function that processes a list of numbers."
-                                retry_response = self.chat.send_message(simple_retry)
-                                if retry_response and hasattr(retry_response, 'text') and retry_response.text:
-                                    print("Simple retry succeeded")
-                                    return retry_response.text.strip()
-                            except:
-                                pass
-                        elif candidate.finish_reason == 4:  # RECITATION
-                            print("Response blocked due to recitation concerns")
-                        else:
-                            print(f"Response finished with reason: {candidate.finish_reason}")
+                    finish_reason = getattr(candidate, 'finish_reason', None)
+                    if finish_reason is not None:
+                        handled = _FINISH_HANDLERS.get(finish_reason, _finish_unknown)(candidate, self)
+                        if handled:
+                            return handled
                     
                     # Try to get content from candidate parts
-                    if hasattr(candidate, 'content') and candidate.content:
-                        if hasattr(candidate.content, 'parts') and candidate.content.parts:
-                            text_parts = []
-                            for part in candidate.content.parts:
-                                if hasattr(part, 'text') and part.text:
-                                    text_parts.append(part.text)
-                            if text_parts:
-                                return '\n'.join(text_parts).strip()
+                    content = getattr(candidate, 'content', None)
+                    parts = getattr(content, 'parts', None) if content else None
+                    if parts:
+                        text_parts = [part.text for part in parts if getattr(part, 'text', None)]
+                        if text_parts:
+                            return '\n'.join(text_parts).strip()
                 
                 print("No text content in response")
                 return None
@@ -165,26 +293,163 @@ Return only the test code with necessary imports."""
             print(f"Generation error: {e}")
             return None
     
-    def get_history(self):
-        """Get chat history."""
-        return self.chat.history if self.chat else []
-    
+    async def send_message_async(self, prompt, source_file_path=None, source_bytes=None, upload_future=None):
+        """Send message to Gemini asynchronously using a stateless model call.
+
+        Unlike send_message, this does not go through the chat session (chat
+        sessions serialize requests), so multiple files can be in flight at once.
+        """
+        if not self.model:
+            print("Model not initialized")
+            return None
+
+        try:
+            contents = [prompt]
+            if source_file_path:
+                try:
+                    # upload_file is a quick metadata call; the blocking part is generation
+                    uploaded_file = self._upload_source(source_file_path, source_bytes, upload_future)
+                    print(f"File uploaded to Gemini: {os.path.basename(source_file_path)}")
+                    contents = [prompt, uploaded_file]
+                except Exception as upload_error:
+                    print(f"File upload failed, sending prompt only: {upload_error}")
+
+            if self._prompt_too_large(contents):
+                return None
+            response = await self.model.generate_content_async(contents)
+            print("Response received (async)")
+
+            if response and hasattr(response, 'text') and response.text:
+                return response.text.strip()
+
+            print("No text content in async response")
+            return None
+
+        except Exception as e:
+            print(f"Async generation error: {e}")
+            return None
+
+    def send_message_stream(self, prompt, source_file_path=None, source_bytes=None, upload_future=None):
+        """Yield response text chunks as they arrive (stream=True).
+
+        Lets the caller start writing the test file to disk while the rest of
+        the generation is still streaming instead of blocking on full text.
+        """
+        if not self.model:
+            print("Model not initialized")
+            return
+
+        contents = [prompt]
+        if source_file_path:
+            try:
+                uploaded_file = self._upload_source(source_file_path, source_bytes, upload_future)
+                print("File uploaded to Gemini")
+                contents = [prompt, uploaded_file]
+            except Exception as upload_error:
+                print(f"File upload failed, sending prompt only: {upload_error}")
+
+        try:
+            response = self.model.generate_content(contents, stream=True)
+            for chunk in response:
+                text = getattr(chunk, 'text', None)
+                if text:
+                    yield text
+        except Exception as e:
+            print(f"Streaming generation error: {e}")
+
     def reset_chat(self):
-        """Reset chat session if needed."""
-        if self.model:
-            self.chat = self.model.start_chat(history=[])
-            print("Chat session reset")
+        """No-op kept for API stability; calls are stateless now."""
+        pass
 
 
-# Global singleton instance
 def get_gemini_chat():
-    """Get the singleton Gemini chat instance."""
+    """Get a Gemini chat-bot wrapper (model and upload cache are shared)."""
     return GeminiChatBot()
 
-def send_prompt_to_llm(prompt, source_file_path=None):
+
+# Disk cache for LLM responses, keyed by prompt text + uploaded file bytes.
+# Re-runs on unchanged inputs skip the network entirely; bypass via --no-cache
+# in the pipeline (sets LLM_TESTGEN_NO_CACHE=1).
+RESPONSE_CACHE_DIR = Path(__file__).parent.parent.parent / ".cache" / "llm_testgen"
+
+def _response_cache_key(prompt, source_file_path=None, source_bytes=None):
+    """Hash prompt text plus uploaded file bytes into a cache key."""
+    digest = hashlib.blake2b(prompt.encode('utf-8'))
+    if source_bytes is not None:
+        digest.update(source_bytes)
+    elif source_file_path:
+        try:
+            with open(source_file_path, 'rb') as f:
+                digest.update(f.read())
+        except Exception:
+            return None
+    return digest.hexdigest()
+
+def _cache_enabled():
+    return os.getenv('LLM_TESTGEN_NO_CACHE', '0') != '1'
+
+def _read_cached_response(cache_key):
+    if not cache_key:
+        return None
+    cache_file = RESPONSE_CACHE_DIR / f"{cache_key}.response"
+    try:
+        if cache_file.exists():
+            print("Using cached LLM response")
+            return cache_file.read_text(encoding='utf-8')
+    except Exception as e:
+        print(f"Response cache read failed: {e}")
+    return None
+
+def _write_cached_response(cache_key, response_text):
+    if not cache_key or not response_text:
+        return
+    try:
+        RESPONSE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        (RESPONSE_CACHE_DIR / f"{cache_key}.response").write_text(response_text, encoding='utf-8')
+    except Exception as e:
+        print(f"Response cache write failed: {e}")
+
+def prewarm_upload(source_file_path):
+    """Warm the model and upload the source; meant for executor.submit while analysis runs."""
+    chat_bot = get_gemini_chat()
+    return chat_bot._upload_source(source_file_path)
+
+def send_prompt_to_llm(prompt, source_file_path=None, source_bytes=None, upload_future=None):
     """Main function for LLM integration."""
+    cache_key = _response_cache_key(prompt, source_file_path, source_bytes) if _cache_enabled() else None
+    cached = _read_cached_response(cache_key)
+    if cached:
+        return cached
+    chat_bot = get_gemini_chat()
+    response = chat_bot.send_message(prompt, source_file_path, source_bytes, upload_future)
+    _write_cached_response(cache_key, response)
+    return response
+
+def send_prompt_to_llm_stream(prompt, source_file_path=None, source_bytes=None, upload_future=None):
+    """Generator yielding response chunks; cached responses yield once."""
+    cache_key = _response_cache_key(prompt, source_file_path, source_bytes) if _cache_enabled() else None
+    cached = _read_cached_response(cache_key)
+    if cached:
+        yield cached
+        return
+    chat_bot = get_gemini_chat()
+    chunks = []
+    for chunk in chat_bot.send_message_stream(prompt, source_file_path, source_bytes, upload_future):
+        chunks.append(chunk)
+        yield chunk
+    if chunks:
+        _write_cached_response(cache_key, ''.join(chunks).strip())
+
+async def send_prompt_to_llm_async(prompt, source_file_path=None, source_bytes=None):
+    """Async variant used for concurrent per-file dispatch."""
+    cache_key = _response_cache_key(prompt, source_file_path, source_bytes) if _cache_enabled() else None
+    cached = _read_cached_response(cache_key)
+    if cached:
+        return cached
     chat_bot = get_gemini_chat()
-    return chat_bot.send_message(prompt, source_file_path)
+    response = await chat_bot.send_message_async(prompt, source_file_path, source_bytes)
+    _write_cached_response(cache_key, response)
+    return response
 
 if __name__ == "__main__":
     # Simple test
@@ -1,9 +1,21 @@
 # random_sample.py
 
+import sys
+
+try:
+    import numpy as np
+except ImportError:          # mutant corpus must stay importable without NumPy
+    np = None
+
+
 def classify_numbers(nums):
     """
     Classify each integer in 'nums' as small / medium / large and
     print an action chosen via a match-case 'switch' statement.
+
+    Vectorized: the positive sum and the per-value actions are computed
+    in bulk with NumPy; the loop only assembles the output lines so the
+    printed text stays byte-identical to the scalar version.
     """
 
     # --- first IF (pre-loop) ---
@@ -11,39 +23,62 @@ def classify_numbers(nums):
         print("Empty list provided.")
         return
 
-    total = 0
-
-    # --- LOOP with nested IFs ---
-    for n in nums:                     # loop
-        # 2nd if (inside loop)
-        if n < 0:
-            print(f"Skipping negative value {n}")
-            continue
-
-        # 3rd if (inside loop)
-        if n == 0:
-            print("Zero encountered – adding nothing.")
-        else:
-            total += n
-
-        # --- SWITCH (match-case) ---
-        match n:                       # switch
-            case 0:
-                action = "do nothing"
-            case 1 | 2 | 3:
-                action = "light work"
-            case 4 | 5 | 6:               
-                action = "moderate work"
-            case _ if n > 6:
-                action = "heavy lifting"
-            case _:
-                action = "undefined"
-        print(f"Value {n}: {action}")
+    lines = []                         # buffered; one write at the end
+
+    # The vectorized path only engages for integer arrays: forcing int64
+    # would truncate floats (2.5 -> 2) and diverge from the scalar fallback,
+    # so non-integer input takes the loop below instead
+    a = np.asarray(nums) if np is not None else None
+    if a is not None and np.issubdtype(a.dtype, np.integer):
+        total = int(a[a > 0].sum())
+        # --- SWITCH (vectorized via masks) ---
+        actions = np.select(
+            [a == 0, (a >= 1) & (a <= 3), (a >= 4) & (a <= 6), a > 6],
+            ["do nothing", "light work", "moderate work", "heavy lifting"],
+            default="undefined",
+        )
+        for n, action in zip(nums, actions):
+            if n < 0:
+                lines.append(f"Skipping negative value {n}")
+                continue
+            if n == 0:
+                lines.append("Zero encountered – adding nothing.")
+            lines.append(f"Value {n}: {action}")
+    else:
+        total = 0
+
+        # --- LOOP with nested IFs (scalar fallback) ---
+        for n in nums:                 # loop
+            # 2nd if (inside loop)
+            if n < 0:
+                lines.append(f"Skipping negative value {n}")
+                continue
+
+            # 3rd if (inside loop)
+            if n == 0:
+                lines.append("Zero encountered – adding nothing.")
+            else:
+                total += n
+
+            # --- SWITCH (match-case) ---
+            match n:                   # switch
+                case 0:
+                    action = "do nothing"
+                case 1 | 2 | 3:
+                    action = "light work"
+                case 4 | 5 | 6:
+                    action = "moderate work"
+                case _ if n > 6:
+                    action = "heavy lifting"
+                case _:
+                    action = "undefined"
+            lines.append(f"Value {n}: {action}")
 
     # --- post-loop output ---
-    print(f"Sum of positive numbers: {total}")
+    lines.append(f"Sum of positive numbers: {total}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-if __name__ != '__main__':
+if __name__ == '__main__':
     sample = [0, 1, -3, 4, 7, 2, 9]
     classify_numbers(sample)
@@ -7,40 +7,109 @@ showing exactly which lines changed and what the changes are.
 """
 
 import difflib
+import functools
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Tuple
 
 
+# Per-process matcher cache keyed by original-file path. SequenceMatcher only
+# caches the b2j index for its b sequence, so the invariant original lives
+# there and each mutant is swapped in via set_seq1 without rebuilding it.
+# Lines are interned to small integers through a shared table first: the
+# matcher then hashes and compares ints instead of whole line strings, and
+# identical lines across mutants map to identical ids for free.
+_MATCHER_CACHE: Dict[str, Tuple[difflib.SequenceMatcher, Dict[str, int]]] = {}
+
+
+def _matcher_for(key: str, original_lines: List[str]) -> Tuple[difflib.SequenceMatcher, Dict[str, int]]:
+    entry = _MATCHER_CACHE.get(key)
+    if entry is None:
+        table: Dict[str, int] = {}
+        orig_ids = [table.setdefault(line, len(table)) for line in original_lines]
+        matcher = difflib.SequenceMatcher(None, autojunk=False)
+        matcher.set_seq2(orig_ids)
+        entry = (matcher, table)
+        _MATCHER_CACHE[key] = entry
+    return entry
+
+
+def _analyze_worker(original_file_str: str, original_lines: List[str], mutant_file_str: str) -> Dict:
+    #Process-pool worker: diffs one mutant against the pre-read original.
+    #Each diff is independent and CPU-bound inside difflib, so mutants scale
+    #across cores; the original's lines travel once per worker via pickling.
+    analyzer = MutantDiffAnalyzer()
+    return analyzer.analyze_mutant_diff(
+        Path(original_file_str), Path(mutant_file_str), original_lines=original_lines
+    )
+
+
 class MutantDiffAnalyzer:
     """Analyzes and reports differences between original and mutant files."""
-    
+
     def __init__(self):
         """Initialize the analyzer."""
         pass
-    
-    def analyze_mutant_diff(self, original_file: Path, mutant_file: Path) -> Dict:
-        #Analyze differences between original and mutant files.
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _load_lines(path_str: str, mtime_ns: int, size: int) -> Tuple[str, ...]:
+        #Cached file load keyed by stat metadata, so repeated diffs against
+        #the same unchanged original decode its bytes once per process.
+        #Returns a tuple to keep the cache entry immutable.
+        return tuple(Path(path_str).read_bytes().decode(
+            'utf-8', 'surrogatepass').splitlines(keepends=True))
+
+    def analyze_mutant_diff(self, original_file: Path, mutant_file: Path,
+                            original_lines: List[str] = None,
+                            include_unified: bool = False) -> Dict:
+        #Analyze differences between original and mutant files. The caller
+        #may pass pre-read original lines so batch runs read the file once.
+        #The unified diff is a second full SequenceMatcher pass that no
+        #current caller displays, so it is only produced on request.
 
         try:
-            # Read file contents
-            with open(original_file, 'r') as f:
-                original_lines = f.readlines()
-            
-            with open(mutant_file, 'r') as f:
-                mutant_lines = f.readlines()
-            
-            # Get unified diff
-            diff_lines = list(difflib.unified_diff(
-                original_lines,
-                mutant_lines,
-                fromfile=f"original/{original_file.name}",
-                tofile=f"mutant/{mutant_file.name}",
-                lineterm=''
-            ))
-            
-            # Extract changed lines
-            changes = self._extract_changes(original_lines, mutant_lines)
+            # Read each file in one bytes read and split once; readlines()
+            # decodes incrementally and allocates line-by-line. The original
+            # goes through the stat-keyed cache so standalone callers that
+            # diff many mutants against it decode its bytes only once.
+            if original_lines is None:
+                st = os.stat(original_file)
+                original_lines = list(self._load_lines(
+                    str(original_file), st.st_mtime_ns, st.st_size))
+
+            mutant_lines = mutant_file.read_bytes().decode(
+                'utf-8', 'surrogatepass').splitlines(keepends=True)
+
+            # Identical content (equivalent mutants, re-runs): bail before
+            # any diff machinery runs; list equality stops at the first
+            # differing line so this costs almost nothing when they differ
+            if original_lines == mutant_lines:
+                return {
+                    'mutant_file': mutant_file.name,
+                    'diff_lines': [] if include_unified else None,
+                    'changes': [],
+                    'summary': f"No changes detected in {mutant_file.name}",
+                    'num_changes': 0
+                }
+
+            # Get unified diff (only when a caller wants to display it)
+            diff_lines = None
+            if include_unified:
+                diff_lines = list(difflib.unified_diff(
+                    original_lines,
+                    mutant_lines,
+                    fromfile=f"original/{original_file.name}",
+                    tofile=f"mutant/{mutant_file.name}",
+                    lineterm=''
+                ))
+
+            # Extract changed lines, reusing the per-original matcher
+            changes = self._extract_changes(
+                original_lines, mutant_lines,
+                matcher_entry=_matcher_for(str(original_file), original_lines)
+            )
             
             # Generate summary
             summary = self._generate_change_summary(changes, mutant_file.name)
@@ -60,23 +129,59 @@ class MutantDiffAnalyzer:
                 'summary': f"Error analyzing {mutant_file.name}: {str(e)}"
             }
     
-    def _extract_changes(self, original_lines: List[str], mutant_lines: List[str]) -> List[Dict]:
+    def _extract_changes(self, original_lines: List[str], mutant_lines: List[str],
+                         matcher_entry: Tuple[difflib.SequenceMatcher, Dict[str, int]] = None) -> List[Dict]:
         """Extract specific line changes between original and mutant."""
         changes = []
-        
-        # Use difflib to find differences
-        matcher = difflib.SequenceMatcher(None, original_lines, mutant_lines)
-        
+
+        # Identical files need no matcher run at all
+        if mutant_lines == original_lines:
+            return changes
+
+        # MutPy mutants replace exactly one line (see separate_mutants), so
+        # when lengths match, locate the differing region with two linear
+        # scans and skip the O(n*m) matcher for the dominant single-line case
+        if len(mutant_lines) == len(original_lines):
+            n = len(original_lines)
+            first = next(k for k in range(n) if original_lines[k] != mutant_lines[k])
+            last = next(k for k in range(n - 1, -1, -1) if original_lines[k] != mutant_lines[k])
+            if first == last:
+                orig_line = original_lines[first].rstrip()
+                mut_line = mutant_lines[first].rstrip()
+                if orig_line != mut_line:
+                    changes.append({
+                        'line_number': first + 1,
+                        'change_type': 'modified',
+                        'original': orig_line,
+                        'mutated': mut_line
+                    })
+                return changes
+
+        if matcher_entry is None:
+            table: Dict[str, int] = {}
+            matcher = difflib.SequenceMatcher(None, autojunk=False)
+            matcher.set_seq2([table.setdefault(line, len(table)) for line in original_lines])
+        else:
+            matcher, table = matcher_entry
+        # Matching runs on interned int ids, not the line strings themselves:
+        # equal lines share an id, so the matcher's hashing and comparisons
+        # are integer ops while the change records below still index the
+        # original strings
+        matcher.set_seq1([table.setdefault(line, len(table)) for line in mutant_lines])
+
+        # Orientation: a = mutant, b = original. 'delete' opcodes are
+        # mutant-only lines (insertions) and 'insert' opcodes are
+        # original-only lines (deletions).
         for tag, i1, i2, j1, j2 in matcher.get_opcodes():
             if tag == 'replace':
                 # Lines were modified
                 for k in range(max(i2-i1, j2-j1)):
-                    orig_idx = i1 + k
-                    mut_idx = j1 + k
-                    
-                    orig_line = original_lines[orig_idx].rstrip() if orig_idx < len(original_lines) else ""
-                    mut_line = mutant_lines[mut_idx].rstrip() if mut_idx < len(mutant_lines) else ""
-                    
+                    mut_idx = i1 + k
+                    orig_idx = j1 + k
+
+                    orig_line = original_lines[orig_idx].rstrip() if orig_idx < j2 else ""
+                    mut_line = mutant_lines[mut_idx].rstrip() if mut_idx < i2 else ""
+
                     if orig_line != mut_line:
                         changes.append({
                             'line_number': orig_idx + 1,
@@ -84,29 +189,29 @@ class MutantDiffAnalyzer:
                             'original': orig_line,
                             'mutated': mut_line
                         })
-            
-            elif tag == 'delete':
-                # Lines were deleted
-                for k in range(i2 - i1):
-                    orig_idx = i1 + k
+
+            elif tag == 'insert':
+                # Lines were deleted from the mutant
+                for k in range(j2 - j1):
+                    orig_idx = j1 + k
                     changes.append({
                         'line_number': orig_idx + 1,
                         'change_type': 'deleted',
                         'original': original_lines[orig_idx].rstrip(),
                         'mutated': ""
                     })
-            
-            elif tag == 'insert':
-                # Lines were inserted
-                for k in range(j2 - j1):
-                    mut_idx = j1 + k
+
+            elif tag == 'delete':
+                # Lines were inserted by the mutant
+                for k in range(i2 - i1):
+                    mut_idx = i1 + k
                     changes.append({
-                        'line_number': i1 + 1,  # Insert position in original
+                        'line_number': j1 + 1,  # Insert position in original
                         'change_type': 'inserted',
                         'original': "",
                         'mutated': mutant_lines[mut_idx].rstrip()
                     })
-        
+
         return changes
     
     def _generate_change_summary(self, changes: List[Dict], mutant_name: str) -> str:
@@ -114,52 +219,64 @@ class MutantDiffAnalyzer:
         if not changes:
             return f"No changes detected in {mutant_name}"
         
-        summary_lines = [f"\n=== MUTANT: {mutant_name} ==="]
-        summary_lines.append(f"Total changes: {len(changes)}")
-        summary_lines.append("")
-        
+        # One preformatted block per change and a single join: ~5 appends
+        # and as many short-lived strings per change collapse into one
+        blocks = [f"\n=== MUTANT: {mutant_name} ===\nTotal changes: {len(changes)}\n"]
+
         for change in changes:
-            line_num = change['line_number']
             change_type = change['change_type']
-            original = change['original']
-            mutated = change['mutated']
-            
-            summary_lines.append(f"Line {line_num} ({change_type}):")
-            
+
             if change_type == 'modified':
-                summary_lines.append(f"  - Original: {original}")
-                summary_lines.append(f"  + Mutated:  {mutated}")
+                body = f"  - Original: {change['original']}\n  + Mutated:  {change['mutated']}"
             elif change_type == 'deleted':
-                summary_lines.append(f"  - Deleted:  {original}")
-            elif change_type == 'inserted':
-                summary_lines.append(f"  + Inserted: {mutated}")
-            
-            summary_lines.append("")
-        
-        return "\n".join(summary_lines)
+                body = f"  - Deleted:  {change['original']}"
+            else:
+                body = f"  + Inserted: {change['mutated']}"
+
+            blocks.append(f"Line {change['line_number']} ({change_type}):\n{body}\n")
+
+        return "\n".join(blocks)
     
     def analyze_all_mutants(self, original_file: Path, mutants_dir: Path) -> List[Dict]:
         #Analyze all mutants in the given directory.
 
         results = []
         
-        # Find all mutant files
-        mutant_files = []
-        for file in mutants_dir.iterdir():
-            if file.is_file() and file.suffix == '.py' and file.name != original_file.name:
-                mutant_files.append(file)
+        # Find all mutant files; scandir hands back DirEntry objects whose
+        # type check reuses the readdir data instead of a stat per Path
+        with os.scandir(mutants_dir) as entries:
+            mutant_files = [
+                Path(entry.path) for entry in entries
+                if entry.name.endswith('.py') and entry.name != original_file.name
+                and entry.is_file(follow_symlinks=False)
+            ]
         
         print(f"Found {len(mutant_files)} mutant files to analyze")
-        
-        for mutant_file in sorted(mutant_files):
-            print(f"Analyzing: {mutant_file.name}")
-            result = self.analyze_mutant_diff(original_file, mutant_file)
-            results.append(result)
-            
-            # Print summary for each mutant
-            if 'summary' in result:
-                print(result['summary'])
-            
+
+        mutant_files.sort()
+        if not mutant_files:
+            return results
+
+        # Read the original once in the parent instead of once per mutant,
+        # then fan the independent diffs out over a process pool; chunksize
+        # amortizes task pickling, and map keeps results in sorted order so
+        # the printed summaries stay deterministic
+        original_lines = original_file.read_bytes().decode(
+            'utf-8', 'surrogatepass').splitlines(keepends=True)
+
+        worker = functools.partial(_analyze_worker, str(original_file), original_lines)
+        with ProcessPoolExecutor() as executor:
+            for mutant_file, result in zip(
+                mutant_files,
+                executor.map(worker, (str(f) for f in mutant_files), chunksize=4)
+            ):
+                print(f"Analyzing: {mutant_file.name}")
+                results.append(result)
+
+                # Print summary for each mutant
+                if 'summary' in result:
+                    print(result['summary'])
+
         return results
 
 
@@ -116,46 +116,47 @@ class MutantGenerator:
         mut_type = "unknown"
         
         try:
-            # Initialize CSV file with header
+            # One CSV handle held open across the loop and one writelines per
+            # mutant: the old per-mutant open(csv, 'a') plus line-by-line
+            # writes cost O(mutants) opens and O(mutants x lines) tiny write
+            # calls, which dominates separation time on large mutant sets
             with open(csv_path, 'w') as csv_file:
                 csv_file.write("mutant_file,mutation_type\n")
-            
-            with open(self.mutants_output, 'r') as f:
-                for ln in f:
-                    ln = ln.lstrip(' ')
-                    
-                    # Parse mutation type
-                    if ln.startswith("- [#"):
-                        ln_mut = ln.split()
-                        if len(ln_mut) > 3:
-                            mut_type = ln_mut[3]
-                    
-                    # Parse mutant code lines
-                    if ln.startswith("+"):
-                        ln_partition = ln.split(":")
-                        ln_num = (ln_partition[0][1:]).lstrip(' ')
-                        ln_content = ln[6:]  # Content after "+ line_num: "
-                        
-                        # Create mutant by modifying the original code
-                        temp = org_data[:]
-                        temp[int(ln_num) - 1] = ln_content
-                        
-                        # Generate mutant file
-                        mutant_name = f"mutant_{self.module_name}_{mutant_count}.py"
-                        mutant_path = self.mutants_dir / mutant_name
-                        
-                        # Write mutant to file
-                        with open(mutant_path, 'w') as mutant_file:
-                            for item in temp:
-                                mutant_file.write(item)
-                        
-                        # Record mutation type in CSV
-                        with open(csv_path, 'a') as csv_file:
+
+                with open(self.mutants_output, 'r') as f:
+                    for ln in f:
+                        ln = ln.lstrip(' ')
+
+                        # Parse mutation type
+                        if ln.startswith("- [#"):
+                            ln_mut = ln.split()
+                            if len(ln_mut) > 3:
+                                mut_type = ln_mut[3]
+
+                        # Parse mutant code lines
+                        if ln.startswith("+"):
+                            ln_partition = ln.split(":")
+                            ln_num = (ln_partition[0][1:]).lstrip(' ')
+                            ln_content = ln[6:]  # Content after "+ line_num: "
+
+                            # Create mutant by modifying the original code
+                            temp = org_data[:]
+                            temp[int(ln_num) - 1] = ln_content
+
+                            # Generate mutant file
+                            mutant_name = f"mutant_{self.module_name}_{mutant_count}.py"
+                            mutant_path = self.mutants_dir / mutant_name
+
+                            # Write mutant to file in one buffered call
+                            with open(mutant_path, 'w') as mutant_file:
+                                mutant_file.writelines(temp)
+
+                            # Record mutation type in CSV
                             csv_file.write(f"{mutant_name},{mut_type}\n")
-                        
-                        mutant_count += 1
-                        self.logger.info(f"Generated mutant: {mutant_name}")
-            
+
+                            mutant_count += 1
+                            self.logger.info(f"Generated mutant: {mutant_name}")
+
             self.logger.info(f"Successfully generated {mutant_count} mutants for {self.module_name}")
             return True
             
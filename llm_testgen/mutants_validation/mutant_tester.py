@@ -6,16 +6,36 @@ This module handles testing individual mutants against test suites.
 Single responsibility: Test mutants and return results.
 """
 
+import ast
+import atexit
+import functools
 import subprocess
+import tempfile
 import time
 import shutil as shutil_module
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Tuple, Optional
 import logging
 
 
+# Matches the counts in pytest's final summary line, e.g.
+# "1 failed, 4 passed in 0.12s"
+_SUMMARY_RE = re.compile(r'(\d+) (passed|failed)')
+
+
+def _test_mutant_worker(tester: 'MutantTester', item: Tuple[str, str]):
+    #Process-pool worker: tests one (source_content, mutant_name) pair in a
+    #per-pid temp subdirectory so parallel workers never collide on the
+    #temp source/test file names.
+    source_content, mutant_name = item
+    worker_dir = tester.temp_dir / f"w{os.getpid()}"
+    worker_dir.mkdir(parents=True, exist_ok=True)
+    return mutant_name, tester.test_single_mutant(source_content, mutant_name, temp_dir=worker_dir)
+
+
 class MutantTester:
     """Handles testing individual mutants against test suites."""
     
@@ -32,8 +52,15 @@ class MutantTester:
         current_working_dir = Path.cwd().resolve()  # This is llm_testgen directory (absolute)
         self.source_dir = current_working_dir / "tests" / "source"
         self.test_dir = current_working_dir / "tests" / "test_suites"
-        # Use temp_test_dir specifically within mutants_validation folder (absolute path)
-        self.temp_dir = current_working_dir / "mutants_validation" / "temp_test_dir"
+        # Mutant scratch space: prefer RAM-backed tmpfs so the per-mutant
+        # source writes and pytest scratch never touch disk; fall back to
+        # the on-repo temp dir where /dev/shm is unavailable (non-Linux)
+        shm = Path('/dev/shm')
+        if shm.is_dir():
+            self.temp_dir = Path(tempfile.mkdtemp(prefix=f"mutant_{module_name}_", dir=shm))
+            atexit.register(shutil_module.rmtree, str(self.temp_dir), ignore_errors=True)
+        else:
+            self.temp_dir = current_working_dir / "mutants_validation" / "temp_test_dir"
         
         # File paths
         self.source_file = self.source_dir / f"{module_name}.py"
@@ -51,66 +78,86 @@ class MutantTester:
         
         # Ensure temp directory exists
         self.temp_dir.mkdir(parents=True, exist_ok=True)
-    
+
+        # Rewritten-test cache: (path, mtime_ns) -> source string, so the
+        # import rewrite is parsed once per test file rather than per mutant
+        self._test_src_cache = None
+        # Temp dirs that already hold the current rewritten test; only the
+        # mutated source changes between mutants, so the test is written once
+        self._test_written = {}
+
     def set_test_file(self, test_file_path: str):
         """Set a custom test file path for testing."""
         self.test_file = Path(test_file_path)
+
+    def _rewrite_test_imports(self, test_content: str) -> str:
+        #Drop the tests/source sys.path bootstrap so the copied test imports
+        #the module from the temp directory. One ast.parse replaces the old
+        #per-mutant multi-line str.replace plus DOTALL-regex fallback, and
+        #works regardless of how the preamble is formatted or commented.
+        try:
+            tree = ast.parse(test_content)
+        except SyntaxError:
+            return test_content
+
+        pruned = []
+        for node in tree.body:
+            if isinstance(node, ast.Assign) and any(
+                    isinstance(t, ast.Name) and t.id in ('current_dir', 'source_dir')
+                    for t in node.targets):
+                continue
+            if (isinstance(node, ast.Expr) and isinstance(node.value, ast.Call)
+                    and isinstance(node.value.func, ast.Attribute)
+                    and node.value.func.attr == 'insert'
+                    and isinstance(node.value.func.value, ast.Attribute)
+                    and node.value.func.value.attr == 'path'):
+                continue
+            pruned.append(node)
+
+        if len(pruned) == len(tree.body):
+            return test_content
+        tree.body = pruned
+        return ast.unparse(tree)
+
+    def _rewritten_test_source(self) -> str:
+        #Return the import-rewritten test source, re-parsing only when the
+        #test file itself changes.
+        key = (str(self.test_file), os.stat(self.test_file).st_mtime_ns)
+        if self._test_src_cache is None or self._test_src_cache[0] != key:
+            with open(self.test_file, 'r') as f:
+                test_content = f.read()
+            self._test_src_cache = (key, self._rewrite_test_imports(test_content))
+        return self._test_src_cache[1]
     
-    def test_single_mutant(self, source_content: str, mutant_name: str) -> Tuple[str, int, int, int, str, str]:
+    def test_single_mutant(self, source_content: str, mutant_name: str,
+                           temp_dir: Optional[Path] = None) -> Tuple[str, int, int, int, str, str]:
         """
-        Test a single mutant against the test suite.
+        Test a single mutant against the test suite. An explicit temp_dir
+        isolates concurrent callers (see test_mutants_parallel).
         """
+        temp_dir = temp_dir or self.temp_dir
         try:
-            # Clear cache directories
-            cache_dirs = [self.temp_dir / "__pycache__", self.temp_dir / ".pytest_cache"]
-            for cache_dir in cache_dirs:
-                if cache_dir.exists():
-                    shutil_module.rmtree(cache_dir)
-            
+            # No cache sweep needed: PYTHONDONTWRITEBYTECODE=1 and
+            # -p no:cacheprovider stop __pycache__/.pytest_cache from ever
+            # being created, so the old pre/post rmtree walks were four
+            # filesystem traversals per mutant for directories that no
+            # longer exist
+
             # Create temporary source file with mutant content
-            temp_source_path = self.temp_dir / f"{self.module_name}.py"
+            temp_source_path = temp_dir / f"{self.module_name}.py"
             with open(temp_source_path, 'w') as f:
                 f.write(source_content)
-            
-            # Copy test file to temp directory and modify import paths
-            temp_test_path = self.temp_dir / f"test_{self.module_name}.py"
-            with open(self.test_file, 'r') as f:
-                test_content = f.read()
-            
-            # Fix the import path in the test file to work in temp directory
-            # Replace the dynamic path resolution with direct import since both files are in same dir
-            modified_test_content = test_content.replace(
-                f'''# Add the tests/source directory to Python path to import the source module
-current_dir = Path(__file__).parent
-source_dir = current_dir.parent / "source"
-sys.path.insert(0, str(source_dir))
-
-import {self.module_name}''',
-                f'''# Import the source module directly (both files are in same temp directory)
-import {self.module_name}'''
-            )
-            
-            # Also handle cases where the import might be formatted differently
-            if modified_test_content == test_content:  # If the above replacement didn't work
-                # Try alternative patterns
-                import re
-                # Pattern to match the path addition and import
-                pattern = r'(# Add.*?import the source module.*?sys\.path\.insert\(0.*?\)\s*)(import\s+' + re.escape(self.module_name) + r')'
-                modified_test_content = re.sub(pattern, r'# Import the source module directly (both files are in same temp directory)\n\2', test_content, flags=re.DOTALL)
-            
-            # Debug: Print if the replacement worked
-            if self.logger:
-                if modified_test_content != test_content:
-                    self.logger.info(f"Successfully modified test file import paths for {mutant_name}")
-                else:
-                    self.logger.warning(f"Failed to modify test file import paths for {mutant_name}")
-                    # Print first few lines of test content for debugging
-                    self.logger.warning("Original test file first 10 lines:")
-                    for i, line in enumerate(test_content.splitlines()[:10], 1):
-                        self.logger.warning(f"  {i}: {line}")
-            
-            with open(temp_test_path, 'w') as f:
-                f.write(modified_test_content)
+
+            # The rewritten test is identical for every mutant, so it lands
+            # in this temp dir once and is refreshed only when the test file
+            # itself changes; per mutant only the source write remains
+            temp_test_path = temp_dir / f"test_{self.module_name}.py"
+            test_src = self._rewritten_test_source()
+            if self._test_written.get(str(temp_dir)) != self._test_src_cache[0] \
+                    or not temp_test_path.exists():
+                with open(temp_test_path, 'w') as f:
+                    f.write(test_src)
+                self._test_written[str(temp_dir)] = self._test_src_cache[0]
             
             # Run the test with timeout in isolated environment
             start_time = time.time()
@@ -120,12 +167,16 @@ import {self.module_name}'''
             env['PYTHONDONTWRITEBYTECODE'] = '1'  # Prevent .pyc file creation
             env['PYTEST_DISABLE_PLUGIN_AUTOLOAD'] = '1'  # Disable plugin autoload
             
+            # importlib import mode skips sys.path/__init__ probing during
+            # collection and no:cacheprovider stops per-run .pytest_cache
+            # churn; both shave fixed overhead off every mutant invocation
             result = subprocess.run(
-                [self.python_executable, "-m", "pytest", str(temp_test_path), "-v", "--tb=short"],
+                [self.python_executable, "-m", "pytest", str(temp_test_path), "-q", "--no-header",
+                 "--tb=short", "-p", "no:cacheprovider", "--import-mode=importlib"],
                 capture_output=True,
                 timeout=30,  # 30 second timeout
                 text=True,
-                cwd=str(self.temp_dir),  # Run in isolated temp directory
+                cwd=str(temp_dir),  # Run in isolated temp directory
                 env=env  # Use modified environment
             )
             execution_time = time.time() - start_time
@@ -147,28 +198,17 @@ import {self.module_name}'''
                     for line in stderr.splitlines()[:20]:
                         self.logger.debug(f"  STDERR: {line}")
             
-            # Parse pytest summary line
-            for line in stdout.split('\n'):
-                if ' passed' in line and ('failed' in line or 'error' in line):
-                    # Format: "X failed, Y passed in Zs"
-                    parts = line.split()
-                    for i, part in enumerate(parts):
-                        if part == 'failed,' and i > 0:
-                            num_fail = int(parts[i-1])
-                        elif part == 'passed' and i > 0:
-                            num_pass = int(parts[i-1])
-                elif ' passed in ' in line:
-                    # Format: "X passed in Zs"
-                    parts = line.split()
-                    for i, part in enumerate(parts):
-                        if part == 'passed' and i > 0:
-                            num_pass = int(parts[i-1])
-                elif ' failed in ' in line:
-                    # Format: "X failed in Zs"
-                    parts = line.split()
-                    for i, part in enumerate(parts):
-                        if part == 'failed' and i > 0:
-                            num_fail = int(parts[i-1])
+            # Parse pytest summary line: the counts live in the one summary
+            # line at the tail of stdout, so one findall over the last few
+            # lines replaces the per-line split/enumerate scan above
+            for line in stdout.rsplit('\n', 6)[-6:]:
+                counts = _SUMMARY_RE.findall(line)
+                if counts:
+                    for num, kind in counts:
+                        if kind == 'passed':
+                            num_pass = int(num)
+                        else:
+                            num_fail = int(num)
             
             num_tests = num_pass + num_fail
             
@@ -192,30 +232,26 @@ import {self.module_name}'''
             self.logger.info(f"\\033[93m{mutant_name}\\033[91m -> Exception: {str(e)}\\033[0m")
             return "ERROR", 0, 0, 1, "0.0s", str(e)
         finally:
-            # Clean up temporary files and any cache directories that might have been created
-            temp_source_path = self.temp_dir / f"{self.module_name}.py"
-            temp_test_path = self.temp_dir / f"test_{self.module_name}.py"
-            
-            if temp_source_path.exists():
-                temp_source_path.unlink()
-            if temp_test_path.exists():
-                temp_test_path.unlink()
-            
-            # Also clean up any cache directories that might have been created
-            cache_dirs_to_clean = [
-                self.temp_dir / "__pycache__", 
-                self.temp_dir / ".pytest_cache",
-                # Prevent any cache directories from being created in parent directories
-                self.temp_dir.parent / "__pycache__",
-                self.temp_dir.parent.parent / "__pycache__"
-            ]
-            for cache_dir in cache_dirs_to_clean:
-                if cache_dir.exists() and cache_dir.is_dir():
-                    try:
-                        shutil_module.rmtree(cache_dir)
-                    except Exception:
-                        pass  # Ignore cleanup errors
+            # Clean up the mutated source; the rewritten test stays in place
+            # so the next mutant reuses it without another write
+            (temp_dir / f"{self.module_name}.py").unlink(missing_ok=True)
     
+    def test_mutants_parallel(self, mutants: list) -> dict:
+        """
+        Test many mutants concurrently.
+
+        Each (source_content, mutant_name) pair runs in a process-pool
+        worker with its own temp subdirectory, so the per-mutant pytest
+        subprocesses overlap across cores instead of paying interpreter
+        startup serially. Results are keyed by mutant name.
+        """
+        results = {}
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            worker = functools.partial(_test_mutant_worker, self)
+            for mutant_name, result in executor.map(worker, mutants):
+                results[mutant_name] = result
+        return results
+
     def test_original_source(self) -> Tuple[str, int, int, int, str, str]:
         """
         Test the original source code to establish baseline.
@@ -212,23 +212,25 @@ def run_mutation_testing_pipeline(module_name: str, csv_report: str, skip_genera
     logger.info(f"\nTesting {len(mutant_files)} mutants...")
     
     test_results = []
-    
+
+    # Run the independent per-mutant pytest invocations across cores; the
+    # results dict is keyed by mutant name, so recording stays in file order
+    mutants = []
     for mutant_file in mutant_files:
-        mutant_name = mutant_file.stem
-        
         with open(mutant_file, 'r') as f:
-            mutant_content = f.read()
-        
-        status, num_tests, num_pass, num_fail, exec_time, error_msg = tester.test_single_mutant(
-            mutant_content, mutant_name
-        )
-        
+            mutants.append((f.read(), mutant_file.stem))
+
+    parallel_results = tester.test_mutants_parallel(mutants)
+
+    for mutant_file in mutant_files:
+        status, num_tests, num_pass, num_fail, exec_time, error_msg = parallel_results[mutant_file.stem]
+
         # Record result
         calculator.record_test_result(
             mutant_file.name, "mutant", status,
             num_tests, num_pass, num_fail, exec_time, error_msg
         )
-        
+
         # Store for score calculation
         test_results.append((
             mutant_file.name, "mutant", status,
@@ -337,22 +339,22 @@ def run_mutation_testing_pipeline(module_name: str, csv_report: str, skip_genera
                         # Test all mutants with merged test suite
                         logger.info(f"Testing {len(mutant_files)} mutants with merged test suite...")
                         final_test_results = []
-                        
+
+                        final_mutants = []
                         for mutant_file in mutant_files:
-                            mutant_name = mutant_file.stem
-                            
                             with open(mutant_file, 'r') as f:
-                                mutant_content = f.read()
-                            
-                            status, num_tests, num_pass, num_fail, exec_time, error_msg = final_tester.test_single_mutant(
-                                mutant_content, mutant_name
-                            )
-                            
+                                final_mutants.append((f.read(), mutant_file.stem))
+
+                        final_parallel_results = final_tester.test_mutants_parallel(final_mutants)
+
+                        for mutant_file in mutant_files:
+                            status, num_tests, num_pass, num_fail, exec_time, error_msg = final_parallel_results[mutant_file.stem]
+
                             final_calculator.record_test_result(
                                 mutant_file.name, "mutant", status,
                                 num_tests, num_pass, num_fail, exec_time, error_msg
                             )
-                            
+
                             final_test_results.append((
                                 mutant_file.name, "mutant", status,
                                 num_tests, num_pass, num_fail, exec_time, error_msg
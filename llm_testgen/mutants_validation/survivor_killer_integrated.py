@@ -37,8 +37,8 @@ class SurvivorKillerIntegrated:
         # Use existing chat session infrastructure
         try:
             self.chat_bot = get_gemini_chat()
-            if not self.chat_bot.chat:
-                raise RuntimeError("Gemini chat session not available")
+            if not self.chat_bot.model:
+                raise RuntimeError("Gemini model not available")
         except Exception as e:
             self.logger.error(f"Failed to initialize Gemini chat: {e}")
             raise RuntimeError(f"Gemini chat session not available: {e}")
@@ -159,7 +159,7 @@ class SurvivorKillerIntegrated:
             test_file_upload = genai.upload_file(str(existing_test_file))
             
             # Send message with uploaded files and prompt
-            response = self.chat_bot.chat.send_message([
+            response = self.chat_bot.model.generate_content([
                 "Source Code File (original implementation):",
                 source_file_upload,
                 "Existing Test Suite File (for reference structure and style):",
@@ -624,7 +624,7 @@ Please provide the complete merged test suite for {source_name}:"""
             killer_file_upload = genai.upload_file(str(killer_test_file))
             
             # Send message with uploaded files and prompt
-            response = self.chat_bot.chat.send_message([
+            response = self.chat_bot.model.generate_content([
                 "Existing LLM Test Suite:",
                 existing_file_upload,
                 "Killer Tests Suite:",
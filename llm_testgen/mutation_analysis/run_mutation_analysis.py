@@ -210,32 +210,34 @@ class StandaloneMutationAnalyzer:
             print(f"\nTesting {len(mutant_files)} mutants using MutantTester...")
             
             test_results = []
-            
-            for i, mutant_file in enumerate(mutant_files, 1):
-                mutant_name = mutant_file.stem
-                
+
+            # Fan the independent mutant runs out over the process pool,
+            # then record in file order from the name-keyed results
+            mutants = []
+            for mutant_file in mutant_files:
                 with open(mutant_file, 'r') as f:
-                    mutant_content = f.read()
-                
-                status, num_tests, num_pass, num_fail, exec_time, error_msg = tester.test_single_mutant(
-                    mutant_content, mutant_name
-                )
-                
+                    mutants.append((f.read(), mutant_file.stem))
+
+            parallel_results = tester.test_mutants_parallel(mutants)
+
+            for i, mutant_file in enumerate(mutant_files, 1):
+                status, num_tests, num_pass, num_fail, exec_time, error_msg = parallel_results[mutant_file.stem]
+
                 # Record result
                 calculator.record_test_result(
                     mutant_file.name, "mutant", status,
                     num_tests, num_pass, num_fail, exec_time, error_msg
                 )
-                
+
                 # Store for score calculation
                 test_results.append((
                     mutant_file.name, "mutant", status,
                     num_tests, num_pass, num_fail, exec_time, error_msg
                 ))
-                
+
                 # Show progress
                 if i % 5 == 0 or i == len(mutant_files):
-                    print(f"  Progress: {i}/{len(mutant_files)} mutants tested")
+                    print(f"  Progress: {i}/{len(mutant_files)} mutants recorded")
             
             # Step 3: Calculate mutation score using existing calculator
             print(f"\n" + "=" * 50)
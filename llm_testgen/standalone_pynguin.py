@@ -202,28 +202,35 @@ def run_pynguin_standalone(module_name: str, seed_file: str, population_size: in
             universal_newlines=True
         )
         
-        # Stream output in real-time with timeout protection
-        output_lines = []
-        start_time = time.time()
-        while True:
-            if time.time() - start_time > 590:  # Safety timeout (10 seconds before alarm)
+        # Stream output in real-time with timeout protection. Readiness
+        # notification via selectors replaces the readline + poll() busy-wait:
+        # select() sleeps until the child produces data, so idle periods cost
+        # no syscalls and the safety deadline is still honoured.
+        import selectors
+        deadline = time.time() + 590  # Safety timeout (10 seconds before alarm)
+        timed_out = False
+        sel = selectors.DefaultSelector()
+        sel.register(process.stdout, selectors.EVENT_READ)
+        while sel.get_map():
+            events = sel.select(timeout=min(0.5, max(0.0, deadline - time.time())))
+            if time.time() > deadline:
                 logging.warning("Approaching timeout, terminating process")
                 process.terminate()
                 time.sleep(2)
                 if process.poll() is None:
                     process.kill()
+                timed_out = True
                 break
-                
-            output = process.stdout.readline()
-            if output == '' and process.poll() is not None:
-                break
-            if output:
-                line = output.strip()
-                output_lines.append(line)
-                logging.info(f"PYNGUIN: {line}")
-        
+            for key, _ in events:
+                output = key.fileobj.readline()
+                if output == '':
+                    sel.unregister(key.fileobj)
+                    continue
+                logging.info(f"PYNGUIN: {output.strip()}")
+        sel.close()
+
         signal.alarm(0)  # Cancel timeout
-        return_code = process.poll()
+        return_code = process.poll() if timed_out else process.wait()
         
         logging.info("=" * 60)
         logging.info("PYNGUIN EXECUTION COMPLETED")
@@ -1,5 +1,29 @@
 # random_sample.py
 
+# Action lookup table for small non-negative integers: one tuple index
+# replaces the match-case guard chain per iteration; anything past the table
+# is > 6. Non-integral values fall back to the original guard logic.
+_ACTIONS = (
+    ("do nothing",)
+    + ("light work",) * 3
+    + ("moderate work",) * 3
+    + ("heavy lifting",) * 64
+)
+
+
+def _action_for(n):
+    # Match-case literal patterns compare by equality, so 2.0 classified the
+    # same as 2 while 2.5 fell through to "undefined"; mirror that here.
+    if isinstance(n, int) or (isinstance(n, float) and n.is_integer()):
+        idx = int(n)
+        if 0 <= idx < len(_ACTIONS):
+            return _ACTIONS[idx]
+        if idx > 6:
+            return "heavy lifting"
+        return "undefined"
+    return "heavy lifting" if n > 6 else "undefined"
+
+
 def classify_numbers(nums):
     """
     Classify each integer in 'nums' as small / medium / large and
@@ -26,18 +50,8 @@ def classify_numbers(nums):
         else:
             total += n
 
-        # --- SWITCH (match-case) ---
-        match n:                       # switch
-            case 0:
-                action = "do nothing"
-            case 1 | 2 | 3:
-                action = "light work"
-            case 4 | 5 | 6:               
-                action = "moderate work"
-            case _ if n > 6:
-                action = "heavy lifting"
-            case _:
-                action = "undefined"
+        # --- SWITCH (LUT-backed) ---
+        action = _action_for(n)
         print(f"Value {n}: {action}")
 
     # --- post-loop output ---